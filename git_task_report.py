@@ -4,23 +4,52 @@ Git Task Management Report Generator
 Generates Excel reports from Git commit history across multiple repositories.
 """
 
+# Standard library only; third-party packages (openpyxl, and orjson when
+# available) are imported inside the methods that use them
 import os
 import json
 import argparse
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import hashlib
+import tempfile
+import importlib.util
+from datetime import date, datetime, timedelta
 from collections import defaultdict, Counter
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
+
+CACHE_DIR = '.git_task_cache'
+CACHE_MAX_ENTRIES = 10
+GIT_LOG_CHUNK_SIZE = 1 << 16
+
+# Task sheet columns in display order (Repository and Commit Count are not shown)
+TASK_COLUMNS = ('Task Name', 'Task Priority', 'Assign Date', 'Due Date',
+                'Planned End Date', 'Actual End Date', 'Assignee')
+
+# Fixed assignee recorded on every task
+DEFAULT_ASSIGNEE = 'Arvind Sir'
+
+# Date format used for all dates shown in the report
+DISPLAY_DATE_FORMAT = '%d-%m-%Y'
+
+# Named styles registered on each workbook and applied to cells by name
+HEADER_STYLE = 'Task Header'
+TASK_NAME_STYLE = 'Task Name'
+SUMMARY_TITLE_STYLE = 'Summary Title'
+REPO_NAME_STYLE = 'Repository Name'
+
+# Third-party packages; imported lazily where needed after this check passes
+REQUIRED_PACKAGES = ['openpyxl', 'lxml']
 
 class GitTaskReportGenerator:
     def __init__(self):
         self.config = {}
+        self.config_path = None
         self.commits_data = []
         self.repo_stats = {}
+        self.repo_heads = {}
 
     def parse_arguments(self):
         """Parse command line arguments"""
@@ -48,6 +77,10 @@ class GitTaskReportGenerator:
     def load_config_file(self, config_path='git_task_config.json'):
         """Load configuration from JSON file"""
         try:
+            # Reuse configuration already loaded from this path
+            if self.config and self.config_path == config_path:
+                return self.build_config_args(self.config)
+
             if not os.path.exists(config_path):
                 # Create default config file
                 default_config = {
@@ -66,27 +99,39 @@ class GitTaskReportGenerator:
                 print("Please edit the config file and run the script again.")
                 sys.exit(0)
 
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            # Prefer orjson for parsing the config file when it is installed
+            try:
+                import orjson
+                json_loads = orjson.loads
+            except ImportError:
+                json_loads = json.loads
 
-            # Convert to args-like object
-            class ConfigArgs:
-                def __init__(self, config):
-                    self.repos = config.get('repos', ['./'])
-                    self.author = config.get('author', '')
-                    self.since = config.get('since', '')
-                    self.until = config.get('until', '')
-                    self.filename = config.get('filename', '')
-                    setattr(self, 'separate_sheets', config.get('separate_sheets', False))
-                    setattr(self, 'exclude_keywords', config.get('exclude_keywords', []))
+            with open(config_path, 'rb') as f:
+                self.config = json_loads(f.read())
+            self.config_path = config_path
 
             print(f"Loaded configuration from {config_path}")
-            return ConfigArgs(config)
+            return self.build_config_args(self.config)
 
         except Exception as e:
             print(f"Error loading config file: {e}")
             sys.exit(1)
 
+    def build_config_args(self, config):
+        """Convert a configuration dict to an args-like object"""
+        # Convert to args-like object
+        class ConfigArgs:
+            def __init__(self, config):
+                self.repos = config.get('repos', ['./'])
+                self.author = config.get('author', '')
+                self.since = config.get('since', '')
+                self.until = config.get('until', '')
+                self.filename = config.get('filename', '')
+                setattr(self, 'separate_sheets', config.get('separate_sheets', False))
+                setattr(self, 'exclude_keywords', config.get('exclude_keywords', []))
+
+        return ConfigArgs(config)
+
     def validate_date(self, date_str, param_name):
         """Validate and parse date string"""
         if not date_str:
@@ -104,18 +149,165 @@ class GitTaskReportGenerator:
             print(f"Error: Repository path does not exist: {repo_path}")
             return False
 
-        git_dir = os.path.join(repo_path, '.git')
-        if not os.path.exists(git_dir):
+        # Resolving HEAD confirms this is a git repository and gives the cache key sha
+        head = self.get_repo_head(repo_path)
+        if not head:
             print(f"Error: Not a git repository: {repo_path}")
             return False
 
+        self.repo_heads[repo_path] = head
         return True
 
-    def get_git_commits(self, repo_path, author=None, since=None, until=None, exclude_keywords=None):
+    def get_repo_head(self, repo_path):
+        """Return the HEAD commit sha if repo_path is a repository root, else None"""
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--show-toplevel', 'HEAD'],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+        # rev-parse walks up parent directories, so only accept the repository root
+        toplevel, head = result.stdout.splitlines()
+        if os.path.realpath(toplevel) != os.path.realpath(repo_path):
+            return None
+
+        return head
+
+    def get_repo_name(self, repo_path):
+        """Return the display name used for a repository in the report"""
+        # Interned so repo comparisons on fresh and cached commits are cheap
+        return sys.intern('current' if repo_path == './' else os.path.basename(os.path.normpath(repo_path)))
+
+    def get_cache_path(self, repo_path, head, author, since, until, exclude_keywords):
+        """Build the cache file path for a git log query"""
+        key_data = (
+            os.path.abspath(repo_path),
+            head,
+            author or '',
+            since.strftime('%Y-%m-%d') if since else '',
+            until.strftime('%Y-%m-%d') if until else '',
+            tuple(exclude_keywords or [])
+        )
+        key = hashlib.sha1(repr(key_data).encode()).hexdigest()
+        return os.path.join(CACHE_DIR, key + '.json')
+
+    def load_cached_commits(self, cache_path, repo_name):
+        """Load commits from cache file, or return None on a cache miss"""
+        try:
+            with open(cache_path, 'r') as f:
+                cached_commits = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached_commits, list):
+            return None
+
+        # The display name depends on how the repo path was spelled, so it is
+        # not cached; treat entries of the wrong shape as a cache miss
+        try:
+            commits = [
+                {
+                    'hash': commit['hash'],
+                    'author': commit['author'],
+                    'date': date(int(commit['date'][0:4]), int(commit['date'][5:7]), int(commit['date'][8:10])),
+                    'message': commit['message'],
+                    'repo': repo_name
+                }
+                for commit in cached_commits
+            ]
+        except (TypeError, KeyError, ValueError):
+            return None
+
+        # Mark entry as recently used for LRU eviction
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        return commits
+
+    def save_cached_commits(self, cache_path, commits):
+        """Write commits to cache file and evict least recently used entries"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+
+            serializable = [
+                {
+                    'hash': commit['hash'],
+                    'author': commit['author'],
+                    'date': commit['date'].isoformat(),
+                    'message': commit['message']
+                }
+                for commit in commits
+            ]
+            with open(cache_path, 'w') as f:
+                json.dump(serializable, f)
+
+            # Other worker threads may evict entries concurrently, so entries that
+            # disappear between listing and removal are skipped
+            entries = []
+            for name in os.listdir(CACHE_DIR):
+                if not name.endswith('.json'):
+                    continue
+                entry = os.path.join(CACHE_DIR, name)
+                try:
+                    entries.append((os.path.getmtime(entry), entry))
+                except FileNotFoundError:
+                    pass
+            entries.sort(reverse=True)
+
+            for _, stale_entry in entries[CACHE_MAX_ENTRIES:]:
+                try:
+                    os.remove(stale_entry)
+                except FileNotFoundError:
+                    pass
+        except OSError as e:
+            print(f"Warning: Could not update commit cache: {e}")
+
+    def iter_git_log_records(self, stream, field_count=4):
+        """Yield commit records from NUL-separated git log output as it is read"""
+        fields = []
+        pending = ''
+
+        for chunk in iter(lambda: stream.read(GIT_LOG_CHUNK_SIZE), ''):
+            parts = (pending + chunk).split('\x00')
+            pending = parts.pop()
+            fields.extend(parts)
+
+            # Zipping one iterator against itself groups fields into records in C,
+            # leaving any incomplete record for the next chunk
+            complete = len(fields) - len(fields) % field_count
+            yield from zip(*[iter(fields[:complete])] * field_count)
+            fields = fields[complete:]
+
+        fields.append(pending)
+        yield from zip(*[iter(fields)] * field_count)
+
+    def get_git_commits(self, repo_path, author=None, since=None, until=None, exclude_keywords=None, head=None):
         """Extract git commits from repository"""
         try:
+            repo_name = self.get_repo_name(repo_path)
+
+            # Reuse cached results while HEAD and filters are unchanged
+            if not head:
+                head = self.get_repo_head(repo_path)
+            cache_path = None
+
+            if head:
+                cache_path = self.get_cache_path(repo_path, head, author, since, until, exclude_keywords)
+                cached_commits = self.load_cached_commits(cache_path, repo_name)
+                if cached_commits is not None:
+                    return cached_commits
+
             # Build git log command
-            cmd = ['git', 'log', '--pretty=format:%H|%an|%ad|%s', '--date=short']
+            # Let git drop merge commits and emit NUL-separated fields, so
+            # commit messages containing '|' or newlines parse unambiguously
+            cmd = ['git', 'log', '--no-merges', '-z', '--pretty=format:%H%x00%an%x00%ad%x00%s', '--date=short']
             
             if author:
                 cmd.extend(['--author', author])
@@ -126,42 +318,40 @@ class GitTaskReportGenerator:
             if until:
                 cmd.extend(['--until', until.strftime('%Y-%m-%d')])
             
-            # Execute git log command
-            result = subprocess.run(
-                cmd, 
-                cwd=repo_path, 
-                capture_output=True, 
-                text=True,
-                check=True
-            )
-            
             commits = []
             exclude_keywords = exclude_keywords or []
             
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
+            # Stream git log output and parse records as they arrive; stderr goes
+            # to a temp file so a noisy git cannot block on a full stderr pipe
+            with tempfile.TemporaryFile(mode='w+') as stderr_file:
+                with subprocess.Popen(
+                    cmd,
+                    cwd=repo_path,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    bufsize=GIT_LOG_CHUNK_SIZE
+                ) as process:
+                    for commit_hash, commit_author, commit_date, commit_message in self.iter_git_log_records(process.stdout):
+                        # Skip commits containing excluded keywords
+                        if exclude_keywords and any(keyword.lower() in commit_message.lower() for keyword in exclude_keywords):
+                            continue
                 
-                parts = line.split('|', 3)
-                if len(parts) >= 4:
-                    commit_hash, commit_author, commit_date, commit_message = parts
-                    
-                    # Skip merge commits
-                    if commit_message.startswith('Merge'):
-                        continue
-                    
-                    # Skip commits containing excluded keywords
-                    if exclude_keywords and any(keyword.lower() in commit_message.lower() for keyword in exclude_keywords):
-                        continue
-                    
-                    commits.append({
-                        'hash': commit_hash,
-                        'author': commit_author,
-                        'date': datetime.strptime(commit_date, '%Y-%m-%d').date(),
-                        'message': commit_message.strip(),
-                        'repo': os.path.basename(repo_path) if repo_path != './' else 'current'
-                    })
-            
+                        commits.append({
+                            'hash': commit_hash,
+                            'author': commit_author,
+                            'date': date(int(commit_date[0:4]), int(commit_date[5:7]), int(commit_date[8:10])),
+                            'message': commit_message.strip(),
+                            'repo': repo_name
+                        })
+
+                if process.returncode:
+                    stderr_file.seek(0)
+                    raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr_file.read())
+
+            if cache_path:
+                self.save_cached_commits(cache_path, commits)
+
             return commits
             
         except subprocess.CalledProcessError as e:
@@ -174,113 +364,100 @@ class GitTaskReportGenerator:
 
     def merge_commits_by_date(self, commits):
         """Merge commits that share the same date"""
-        date_commits = defaultdict(list)
-        
-        # Group by date only (not by date AND repo)
-        for commit in commits:
-            date_commits[commit['date']].append(commit)
-        
+        # Sort once by date, repo name, then message so each date group is already ordered
+        sorted_commits = sorted(commits, key=itemgetter('date', 'repo', 'message'))
+
         merged_commits = []
-        for commit_date, commits_list in date_commits.items():
-            # Sort commits by repo name, then by message
-            commits_list.sort(key=lambda x: (x['repo'], x['message']))
-            
+
+        # Group by date only (not by date AND repo)
+        for commit_date, group in groupby(sorted_commits, key=itemgetter('date')):
+            commits_list = list(group)
+
             # Format each commit message with repo name and join with line breaks
-            formatted_messages = []
-            for commit in commits_list:
-                formatted_message = f"{commit['message']} ({commit['repo']})"
-                formatted_messages.append(formatted_message)
-            
-            # Join messages with line breaks (ensure proper line break character)
-            merged_message = '\n'.join(formatted_messages)
-            
+            merged_message = '\n'.join(f"{commit['message']} ({commit['repo']})" for commit in commits_list)
+            repos = {commit['repo'] for commit in commits_list}
+
             merged_commits.append({
                 'date': commit_date,
                 'message': merged_message,
-                'repo': 'combined' if len(set(c['repo'] for c in commits_list)) > 1 else commits_list[0]['repo'],
+                'repo': 'combined' if len(repos) > 1 else commits_list[0]['repo'],
                 'commit_count': len(commits_list)
             })
-        
-        return merged_commits
-
 
+        return merged_commits
 
-    def generate_task_rows(self, merged_commits):
-        """Generate task management rows from merged commits"""
-        tasks = []
-
-        for commit in merged_commits:
-            actual_end_date = commit['date']
-            assign_date = actual_end_date - timedelta(days=1)
-            planned_end_date = assign_date
-
-            task = {
-                'Task Name': commit['message'],
-                'Task Priority': '',  # Leave blank
-                'Assign Date': assign_date.strftime('%d-%m-%Y'),
-                'Due Date': '',  # Leave blank
-                'Planned End Date': planned_end_date.strftime('%d-%m-%Y'),
-                'Actual End Date': actual_end_date.strftime('%d-%m-%Y'),
-                'Assignee': 'Arvind Sir',
-                'Repository': commit['repo'],
-                'Commit Count': commit['commit_count']
-            }
-
-            tasks.append(task)
-
-        # Sort by actual end date
-        tasks.sort(key=lambda x: datetime.strptime(x['Actual End Date'], '%d-%m-%Y'))
 
-        return tasks
 
     def generate_repo_statistics(self, all_commits):
         """Generate per-repository statistics"""
-        stats = {}
+        # Collect per-repository dates and authors in a single pass over all commits
+        repo_data = defaultdict(lambda: {'dates': [], 'authors': set()})
 
-        for repo in set(commit['repo'] for commit in all_commits):
-            repo_commits = [c for c in all_commits if c['repo'] == repo]
+        for commit in all_commits:
+            data = repo_data[commit['repo']]
+            data['dates'].append(commit['date'])
+            data['authors'].add(commit['author'])
 
-            if not repo_commits:
-                continue
+        stats = {}
 
-            # Calculate statistics
-            total_commits = len(repo_commits)
-            date_counts = Counter(c['date'] for c in repo_commits)
+        for repo, data in repo_data.items():
+            # Calculate statistics; Counter, min and max all loop in C
+            total_commits = len(data['dates'])
+            date_counts = Counter(data['dates'])
 
-            earliest_date = min(c['date'] for c in repo_commits)
-            latest_date = max(c['date'] for c in repo_commits)
+            earliest_date = min(date_counts)
+            latest_date = max(date_counts)
 
             date_range = (latest_date - earliest_date).days + 1
             avg_commits_per_day = total_commits / date_range if date_range > 0 else total_commits
 
             stats[repo] = {
                 'Total Commits': total_commits,
-                'Date Range': f"{earliest_date.strftime('%d-%m-%Y')} to {latest_date.strftime('%d-%m-%Y')}",
+                'Date Range': f"{earliest_date.strftime(DISPLAY_DATE_FORMAT)} to {latest_date.strftime(DISPLAY_DATE_FORMAT)}",
                 'Days with Commits': len(date_counts),
                 'Average Commits per Day': round(avg_commits_per_day, 2),
                 'Max Commits in a Day': max(date_counts.values()) if date_counts else 0,
-                'Authors': len(set(c['author'] for c in repo_commits))
+                'Authors': len(data['authors'])
             }
 
         return stats
 
-    def create_excel_report(self, tasks, repo_stats, filename, separate_sheets=False):
-        """Create Excel report with formatting"""
-        wb = Workbook()
-
-        # Remove default sheet
-        wb.remove(wb.active)
-
-        if separate_sheets:
-            # Create separate sheet for each repository
-            repos = set(task['Repository'] for task in tasks)
-
-            for repo in sorted(repos):
-                repo_tasks = [task for task in tasks if task['Repository'] == repo]
-                self.create_task_sheet(wb, f"Tasks_{repo}", repo_tasks)
-        else:
-            # Create single sheet for all repositories
-            self.create_task_sheet(wb, "All_Tasks", tasks)
+    def create_excel_report(self, sheet_commits, repo_stats, filename):
+        """Create Excel report with formatting
+
+        sheet_commits maps each task sheet name to its merged commits, sorted by date.
+        """
+        from openpyxl import Workbook
+        from copy import copy
+        from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+        from openpyxl.styles.borders import DEFAULT_BORDER
+        from openpyxl.styles.fonts import DEFAULT_FONT
+
+        # Write-only mode streams rows to disk instead of holding the workbook in memory
+        wb = Workbook(write_only=True)
+
+        # Register shared styles once so each cell only references them by name;
+        # NamedStyle fills unset attributes with empty objects, so the workbook's
+        # default border (and font, for Task Name) is passed explicitly
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            border=copy(DEFAULT_BORDER),
+            alignment=Alignment(horizontal="center", vertical='top')
+        ))
+        # Task Name cells only change alignment and keep the workbook's default font
+        wb.add_named_style(NamedStyle(
+            name=TASK_NAME_STYLE,
+            font=copy(DEFAULT_FONT),
+            border=copy(DEFAULT_BORDER),
+            alignment=Alignment(wrap_text=True, vertical='top')
+        ))
+        wb.add_named_style(NamedStyle(name=SUMMARY_TITLE_STYLE, font=Font(bold=True, size=14), border=copy(DEFAULT_BORDER)))
+        wb.add_named_style(NamedStyle(name=REPO_NAME_STYLE, font=Font(bold=True), border=copy(DEFAULT_BORDER)))
+
+        for sheet_name, merged_commits in sheet_commits.items():
+            self.create_task_sheet(wb, sheet_name, merged_commits)
 
         # Create summary sheet
         self.create_summary_sheet(wb, repo_stats)
@@ -289,98 +466,100 @@ class GitTaskReportGenerator:
         wb.save(filename)
         print(f"Excel report saved: {filename}")
 
-    def create_task_sheet(self, workbook, sheet_name, tasks):
-        """Create a task sheet in the workbook"""
+    def create_task_sheet(self, workbook, sheet_name, merged_commits, assignee=DEFAULT_ASSIGNEE):
+        """Create a task sheet in the workbook from merged commits"""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
         ws = workbook.create_sheet(title=sheet_name)
         
-        # Define columns (excluding Repository and Commit Count for display)
-        columns = ['Task Name', 'Task Priority', 'Assign Date', 'Due Date', 
-                'Planned End Date', 'Actual End Date', 'Assignee']
-        
-        # Add headers
-        for col, header in enumerate(columns, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center",vertical='top')
-        
-        # Add data
-        for row, task in enumerate(tasks, 2):
-            for col, header in enumerate(columns, 1):
-                cell = ws.cell(row=row, column=col, value=task[header])
-                
-                # Enable text wrapping for Task Name column
-                if header == 'Task Name':
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        # For cells with line breaks, consider only the longest line
-                        if '\n' in str(cell.value):
-                            lines = str(cell.value).split('\n')
-                            cell_length = max(len(line) for line in lines)
-                        else:
-                            cell_length = len(str(cell.value))
-                        
-                        if cell_length > max_length:
-                            max_length = cell_length
-                except:
-                    pass
-            
-            # Set column width
-            if column_letter == 'A':  # Task Name column
+        # Build one row tuple per merged commit in TASK_COLUMNS order; widths
+        # are measured from these before any rows are written in write-only mode
+        rows = []
+        for commit in merged_commits:
+            actual_end_date = commit['date'].strftime(DISPLAY_DATE_FORMAT)
+            # Assign and planned end dates are one day before the commit date
+            assign_date = (commit['date'] - timedelta(days=1)).strftime(DISPLAY_DATE_FORMAT)
+
+            # Task Priority and Due Date are left blank
+            rows.append((commit['message'], '', assign_date, '', assign_date, actual_end_date, assignee))
+
+        max_lengths = [len(header) for header in TASK_COLUMNS]
+
+        for row in rows:
+            for col, value in enumerate(row):
+                # For cells with line breaks, consider only the longest line
+                if '\n' in value:
+                    cell_length = max(map(len, value.split('\n')))
+                else:
+                    cell_length = len(value)
+
+                if cell_length > max_lengths[col]:
+                    max_lengths[col] = cell_length
+
+        for col, max_length in enumerate(max_lengths):
+            if col == 0:  # Task Name column
                 adjusted_width = min(max_length + 10, 120)
             else:
                 adjusted_width = min(max_length + 3, 50)
-            
-            ws.column_dimensions[column_letter].width = adjusted_width
 
+            ws.column_dimensions[get_column_letter(col + 1)].width = adjusted_width
+
+        # Add headers
+        header_row = []
+        for header in TASK_COLUMNS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = HEADER_STYLE
+            header_row.append(cell)
+        ws.append(header_row)
+        
+        # Add data
+        for row in rows:
+            # Enable text wrapping for Task Name column
+            task_name_cell = WriteOnlyCell(ws, value=row[0])
+            task_name_cell.style = TASK_NAME_STYLE
+
+            ws.append((task_name_cell,) + row[1:])
 
 
     def create_summary_sheet(self, workbook, repo_stats):
         """Create summary sheet with repository statistics"""
-        ws = workbook.create_sheet(title="Summary")
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
 
-        row = 1
+        ws = workbook.create_sheet(title="Summary")
 
-        # Title
-        ws.cell(row=row, column=1, value="Repository Analysis Summary").font = Font(bold=True, size=14)
-        row += 2
+        # Collect rows first so column widths can be set before writing in write-only mode;
+        # each entry pairs the row values with the named style for its first cell
+        rows = [(["Repository Analysis Summary"], SUMMARY_TITLE_STYLE), ([], None)]
 
         for repo, stats in repo_stats.items():
             # Repository name
-            ws.cell(row=row, column=1, value=f"Repository: {repo}").font = Font(bold=True)
-            row += 1
+            rows.append(([f"Repository: {repo}"], REPO_NAME_STYLE))
 
             # Statistics
             for stat_name, stat_value in stats.items():
-                ws.cell(row=row, column=2, value=stat_name)
-                ws.cell(row=row, column=3, value=stat_value)
-                row += 1
+                rows.append(([None, stat_name, stat_value], None))
 
-            row += 1  # Empty row between repositories
+            rows.append(([], None))  # Empty row between repositories
 
         # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-
-            for cell in column:
-                try:
-                    cell_length = len(str(cell.value)) if cell.value else 0
-                    if cell_length > max_length:
-                        max_length = cell_length
-                except:
-                    pass
-
-            adjusted_width = max_length + 2
-            ws.column_dimensions[column_letter].width = adjusted_width
+        max_lengths = defaultdict(int)
+        for values, _ in rows:
+            for col, value in enumerate(values, 1):
+                cell_length = len(str(value)) if value else 0
+                if cell_length > max_lengths[col]:
+                    max_lengths[col] = cell_length
+
+        for col, max_length in max_lengths.items():
+            ws.column_dimensions[get_column_letter(col)].width = max_length + 2
+
+        for values, style in rows:
+            if style:
+                cell = WriteOnlyCell(ws, value=values[0])
+                cell.style = style
+                values = [cell] + values[1:]
+            ws.append(values)
 
     def generate_filename(self, since_date, until_date, custom_filename):
         """Generate output filename"""
@@ -405,28 +584,38 @@ class GitTaskReportGenerator:
             since_date = self.validate_date(args.since, 'since')
             until_date = self.validate_date(args.until, 'until')
 
-            # Validate repositories
-            valid_repos = []
-            for repo in args.repos:
-                if self.validate_repository(repo):
-                    valid_repos.append(repo)
+            # git is I/O bound, so validation and git log both run in a thread pool
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(args.repos)))) as executor:
+                # Validate repositories; each check spawns git rev-parse
+                validity = list(executor.map(self.validate_repository, args.repos))
+                valid_repos = [repo for repo, is_valid in zip(args.repos, validity) if is_valid]
 
-            if not valid_repos:
-                print("Error: No valid repositories found.")
-                sys.exit(1)
+                if not valid_repos:
+                    print("Error: No valid repositories found.")
+                    sys.exit(1)
 
-            print(f"Processing {len(valid_repos)} repositories...")
+                print(f"Processing {len(valid_repos)} repositories...")
 
-            # Extract commits from all repositories
-            all_commits = []
+                # Extract commits from all repositories
+                all_commits = []
 
-            for i, repo in enumerate(valid_repos, 1):
-                print(f"[{i}/{len(valid_repos)}] Processing repository: {repo}")
+                exclude_keywords = getattr(args, 'exclude_keywords', [])
+
+                futures = {
+                    executor.submit(
+                        self.get_git_commits, repo, args.author, since_date, until_date,
+                        exclude_keywords, self.repo_heads.get(repo)
+                    ): repo
+                    for repo in valid_repos
+                }
 
-                commits = self.get_git_commits(repo, args.author, since_date, until_date, getattr(args, 'exclude_keywords', []))
-                all_commits.extend(commits)
+                for i, future in enumerate(as_completed(futures), 1):
+                    repo = futures[future]
+                    commits = future.result()
+                    all_commits.extend(commits)
 
-                print(f"  Found {len(commits)} commits")
+                    print(f"[{i}/{len(valid_repos)}] Processed repository: {repo}")
+                    print(f"  Found {len(commits)} commits")
 
             if not all_commits:
                 print("No commits found matching the criteria.")
@@ -437,34 +626,30 @@ class GitTaskReportGenerator:
             # Generate repository statistics
             repo_stats = self.generate_repo_statistics(all_commits)
 
-            # Generate tasks
+            # Merge commits into tasks; merge_commits_by_date returns them sorted
+            # by actual end date (the commit date)
             if getattr(args, 'separate_sheets', False):
-                # Process each repository separately
-                all_tasks = []
-
-                for repo in set(commit['repo'] for commit in all_commits):
-                    repo_commits = [c for c in all_commits if c['repo'] == repo]
-                    merged_commits = self.merge_commits_by_date(repo_commits)
-                    repo_tasks = self.generate_task_rows(merged_commits)
-                    all_tasks.extend(repo_tasks)
+                # Create separate sheet for each repository
+                repo_commits_map = defaultdict(list)
+                for commit in all_commits:
+                    repo_commits_map[commit['repo']].append(commit)
+
+                sheet_commits = {
+                    f"Tasks_{repo}": self.merge_commits_by_date(repo_commits_map[repo])
+                    for repo in sorted(repo_commits_map)
+                }
             else:
-                # Process all repositories together
-                merged_commits = self.merge_commits_by_date(all_commits)
-                all_tasks = self.generate_task_rows(merged_commits)
+                # Create single sheet for all repositories
+                sheet_commits = {"All_Tasks": self.merge_commits_by_date(all_commits)}
 
             # Generate filename
             filename = self.generate_filename(since_date, until_date, args.filename)
 
             # Create Excel report
-            self.create_excel_report(
-                all_tasks, 
-                repo_stats, 
-                filename, 
-                getattr(args, 'separate_sheets', False)
-            )
+            self.create_excel_report(sheet_commits, repo_stats, filename)
 
             print(f"\nTask report generated successfully!")
-            print(f"Tasks created: {len(all_tasks)}")
+            print(f"Tasks created: {sum(len(merged_commits) for merged_commits in sheet_commits.values())}")
             print(f"Output file: {filename}")
 
         except KeyboardInterrupt:
@@ -475,14 +660,11 @@ class GitTaskReportGenerator:
             sys.exit(1)
 
 if __name__ == "__main__":
-    # Check required packages
-    required_packages = ['pandas', 'openpyxl']
+    # Check required packages without importing them, before anything uses them
     missing_packages = []
 
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+    for package in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
 
     if missing_packages: